@@ -8,21 +8,208 @@ Autor: Sistema Guardião Digital
 Data: 2024
 """
 
+import os
+import re
+import html
+import time
+import string
+import random
 import smtplib
 import configparser
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
 
 try:
-    from telegram import Bot
-    from telegram.error import TelegramError
+    import httpx
     TELEGRAM_AVAILABLE = True
+    # O httpx registra a URL de cada requisição em INFO, e a URL da API contém o token do bot
+    logging.getLogger('httpx').setLevel(logging.WARNING)
 except ImportError:
     TELEGRAM_AVAILABLE = False
-    logging.warning("Biblioteca python-telegram-bot não encontrada. Notificações Telegram desabilitadas.")
+    logger.warning("Biblioteca httpx não encontrada. Notificações Telegram desabilitadas.")
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+class TelegramError(Exception):
+    """
+    Erro retornado pela API do Telegram Bot.
+    """
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Args:
+            message (str): Descrição do erro retornada pela API
+            status_code (Optional[int]): Código HTTP da resposta
+            retry_after (Optional[float]): Segundos de espera sugeridos pela API (HTTP 429)
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+    
+    @property
+    def retryable(self) -> bool:
+        """
+        Indica se o erro é transitório (limite de requisições ou erro do servidor).
+        """
+        return self.status_code is not None and (self.status_code == 429 or self.status_code >= 500)
+
+
+T = TypeVar('T')
+
+# Erros transitórios que justificam nova tentativa de envio.
+# SMTPAuthenticationError não está incluído: credenciais inválidas não se resolvem sozinhas.
+RETRYABLE_ERRORS: Tuple[type, ...] = (
+    TelegramError,
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    TimeoutError,
+    ConnectionError,
+)
+if TELEGRAM_AVAILABLE:
+    RETRYABLE_ERRORS += (httpx.TransportError,)
+
+
+def _retry(fn: Callable[[], T], attempts: int = 3, base: float = 0.5,
+           retryable: Tuple[type, ...] = RETRYABLE_ERRORS) -> Tuple[T, int]:
+    """
+    Executa fn com novas tentativas e backoff exponencial com jitter para erros transitórios.
+    
+    Args:
+        fn (Callable[[], T]): Operação a executar
+        attempts (int): Número máximo de tentativas
+        base (float): Espera base em segundos (dobrada a cada tentativa, limitada a 15s)
+        retryable (Tuple[type, ...]): Exceções consideradas transitórias
+        
+    Returns:
+        Tuple[T, int]: (resultado de fn, número de tentativas realizadas)
+        
+    Raises:
+        Exception: A última exceção, se não for transitória ou se as tentativas se esgotarem
+    """
+    for attempt in range(attempts):
+        try:
+            return fn(), attempt + 1
+        except retryable as e:
+            if attempt == attempts - 1 or not getattr(e, 'retryable', True):
+                raise
+            
+            delay = getattr(e, 'retry_after', None)
+            if delay is None:
+                delay = base * 2 ** attempt + random.random() * 0.1
+            delay = min(delay, 15)
+            
+            logger.warning(f"Falha transitória na tentativa {attempt + 1}/{attempts} ({e}), "
+                           f"nova tentativa em {delay:.1f}s")
+            time.sleep(delay)
+
+
+# Cache de configurações já carregadas: (classe, caminho) -> (mtime, tamanho, instância)
+_CFG_CACHE: Dict[Tuple[type, str], Tuple[float, int, object]] = {}
+_CFG_CACHE_LOCK = threading.Lock()
+
+
+def cached_config(cls: type, config_file: str):
+    """
+    Retorna uma instância de cls para o arquivo, reutilizando a instância em cache
+    enquanto o mtime e o tamanho do arquivo não mudarem.
+    
+    Args:
+        cls (type): Classe de configuração (construída com o caminho do arquivo)
+        config_file (str): Caminho para o arquivo de configuração
+        
+    Returns:
+        Instância de cls com a configuração carregada
+    """
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        # Arquivo inexistente: não há como validar o cache
+        return cls(config_file)
+    
+    key = (st.st_mtime, st.st_size)
+    with _CFG_CACHE_LOCK:
+        cached = _CFG_CACHE.get((cls, config_file))
+        if cached is not None and cached[:2] == key:
+            return cached[2]
+        
+        instance = cls(config_file)
+        _CFG_CACHE[(cls, config_file)] = (st.st_mtime, st.st_size, instance)
+        return instance
+
+
+# Modelo HTML dos emails de alerta (valores devem ser escapados com html.escape)
+_HTML_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #dc3545; color: white; padding: 15px; border-radius: 5px; }
+        .content { background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-top: 10px; }
+        .info { margin: 10px 0; }
+        .footer { margin-top: 20px; font-size: 12px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h2>🚨 Alerta de Falha de Backup - Guardião Digital</h2>
+    </div>
+    <div class="content">
+        <div class="info"><strong>Cliente:</strong> $client_name</div>
+        <div class="info"><strong>Status:</strong> $status</div>
+        <div class="info"><strong>Motivo:</strong> $reason</div>
+        <div class="info"><strong>Data/Hora:</strong> $timestamp</div>
+    </div>
+    <div class="footer">
+        <p>Este é um alerta automático do sistema Guardião Digital.</p>
+        <p>Por favor, verifique o backup do cliente o mais breve possível.</p>
+    </div>
+</body>
+</html>
+""")
+
+# Modelo Markdown das mensagens Telegram (valores devem ser escapados com _escape_markdown)
+_TELEGRAM_TEMPLATE = """
+🚨 *ALERTA GUARDIÃO DIGITAL*
+
+👤 *Cliente:* {client_name}
+📊 *Status:* {status}
+❌ *Motivo:* {reason}
+🕐 *Data/Hora:* {timestamp}
+
+⚠️ Verifique o backup do cliente imediatamente!
+""".strip()
+
+_MARKDOWN_SPECIAL_CHARS = re.compile(r'([_*`\[])')
+
+
+def _escape_markdown(text: str) -> str:
+    """
+    Escapa os caracteres especiais do modo Markdown da API do Telegram.
+    
+    Args:
+        text (str): Texto a ser inserido na mensagem
+        
+    Returns:
+        str: Texto com os caracteres especiais escapados
+    """
+    return _MARKDOWN_SPECIAL_CHARS.sub(r'\\\1', text)
 
 
 class AlerterConfig:
@@ -44,6 +231,20 @@ class AlerterConfig:
         self.config_file = config_file
         self.load_config()
     
+    @classmethod
+    def get(cls, config_file: str = 'config.ini') -> 'AlerterConfig':
+        """
+        Retorna a configuração do arquivo, reutilizando a instância em cache
+        enquanto o mtime e o tamanho do arquivo não mudarem.
+        
+        Args:
+            config_file (str): Caminho para o arquivo de configuração
+            
+        Returns:
+            AlerterConfig: Configuração carregada
+        """
+        return cached_config(cls, config_file)
+    
     def load_config(self) -> None:
         """
         Carrega as configurações do arquivo config.ini.
@@ -55,7 +256,7 @@ class AlerterConfig:
         try:
             self.config.read(self.config_file, encoding='utf-8')
         except Exception as e:
-            logging.error(f"Erro ao carregar arquivo de configuração: {e}")
+            logger.error(f"Erro ao carregar arquivo de configuração: {e}")
             raise
     
     def get_email_config(self) -> dict:
@@ -105,9 +306,14 @@ class EmailNotifier:
     Classe responsável pelo envio de notificações por email.
     
     Utiliza SMTP para enviar emails formatados em HTML com informações
-    sobre falhas de backup detectadas.
+    sobre falhas de backup detectadas. Uma única conexão SMTP é mantida entre
+    os envios (protegida por lock, pois smtplib.SMTP não é thread-safe);
+    chame close() ao final do lote.
     """
     
+    # Limite de mensagens enviadas por uma mesma conexão SMTP
+    MAX_MESSAGES_PER_CONNECTION = 10_000
+    
     def __init__(self, config: dict):
         """
         Inicializa o notificador de email com as configurações fornecidas.
@@ -121,6 +327,67 @@ class EmailNotifier:
         self.password = config['password']
         self.from_email = config['from_email']
         self.to_email = config['to_email']
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._messages_sent = 0
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Abre (ou reaproveita) a conexão SMTP autenticada.
+        
+        A conexão é aberta apenas no primeiro envio e reutilizada pelos envios
+        seguintes, sendo renovada ao atingir MAX_MESSAGES_PER_CONNECTION.
+        
+        Returns:
+            smtplib.SMTP: Conexão pronta para envio
+        """
+        if self._smtp is not None and self._messages_sent >= self.MAX_MESSAGES_PER_CONNECTION:
+            self._quit_connection()
+        
+        if self._smtp is None:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            try:
+                server.starttls()
+                server.login(self.username, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+            self._messages_sent = 0
+        
+        return self._smtp
+    
+    def _discard_connection(self) -> None:
+        """
+        Descarta a conexão atual sem enviar QUIT (usado após desconexões).
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+        self._smtp = None
+        self._messages_sent = 0
+    
+    def close(self) -> None:
+        """
+        Encerra a conexão SMTP, se houver uma aberta.
+        """
+        with self._lock:
+            self._quit_connection()
+    
+    def _quit_connection(self) -> None:
+        """
+        Envia QUIT e descarta a conexão atual (o chamador deve deter o lock).
+        """
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception as e:
+            logger.debug(f"Erro ao encerrar conexão SMTP: {e}")
+        finally:
+            self._discard_connection()
     
     def send_email(self, client_name: str, status: str, reason: str) -> bool:
         """
@@ -146,19 +413,32 @@ class EmailNotifier:
             html_part = MIMEText(html_content, 'html', 'utf-8')
             msg.attach(html_part)
             
-            # Enviar email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
+            # Enviar email reaproveitando a conexão (reconecta a cada nova tentativa)
+            _, attempts = _retry(lambda: self._deliver(msg))
             
-            logging.info(f"Email enviado com sucesso para {self.to_email}")
+            logger.info(f"Email enviado com sucesso para {self.to_email} (tentativa {attempts})")
             return True
             
         except Exception as e:
-            logging.error(f"Erro ao enviar email: {e}")
+            logger.error(f"Erro ao enviar email: {e}")
             return False
     
+    def _deliver(self, msg: MIMEMultipart) -> None:
+        """
+        Envia a mensagem pela conexão compartilhada, descartando-a em caso de erro
+        para que a próxima tentativa abra uma conexão nova.
+        
+        Args:
+            msg (MIMEMultipart): Mensagem pronta para envio
+        """
+        with self._lock:
+            try:
+                self._connect().send_message(msg)
+            except Exception:
+                self._discard_connection()
+                raise
+            self._messages_sent += 1
+    
     def _create_html_content(self, client_name: str, status: str, reason: str) -> str:
         """
         Cria o conteúdo HTML para o email de alerta.
@@ -173,47 +453,25 @@ class EmailNotifier:
         """
         timestamp = datetime.now().strftime("%d/%m/%Y às %H:%M:%S")
         
-        html_template = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .header {{ background-color: #dc3545; color: white; padding: 15px; border-radius: 5px; }}
-                .content {{ background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-top: 10px; }}
-                .info {{ margin: 10px 0; }}
-                .footer {{ margin-top: 20px; font-size: 12px; color: #666; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h2>🚨 Alerta de Falha de Backup - Guardião Digital</h2>
-            </div>
-            <div class="content">
-                <div class="info"><strong>Cliente:</strong> {client_name}</div>
-                <div class="info"><strong>Status:</strong> {status}</div>
-                <div class="info"><strong>Motivo:</strong> {reason}</div>
-                <div class="info"><strong>Data/Hora:</strong> {timestamp}</div>
-            </div>
-            <div class="footer">
-                <p>Este é um alerta automático do sistema Guardião Digital.</p>
-                <p>Por favor, verifique o backup do cliente o mais breve possível.</p>
-            </div>
-        </body>
-        </html>
-        """
-        return html_template
+        return _HTML_TEMPLATE.substitute(
+            client_name=html.escape(client_name),
+            status=html.escape(status),
+            reason=html.escape(reason),
+            timestamp=timestamp
+        )
 
 
 class TelegramNotifier:
     """
     Classe responsável pelo envio de notificações via Telegram.
     
-    Utiliza a API do Telegram Bot para enviar mensagens formatadas
-    sobre falhas de backup detectadas.
+    Utiliza a API do Telegram Bot através de um único cliente HTTP persistente
+    para enviar mensagens formatadas sobre falhas de backup detectadas.
+    Chame close() ao final do lote.
     """
     
+    API_BASE_URL = "https://api.telegram.org/bot{token}"
+    
     def __init__(self, config: dict):
         """
         Inicializa o notificador do Telegram com as configurações fornecidas.
@@ -223,13 +481,34 @@ class TelegramNotifier:
         """
         self.bot_token = config['bot_token']
         self.chat_id = config['chat_id']
-        self.bot = None
+        self._client = None
         
         if TELEGRAM_AVAILABLE and self.bot_token:
             try:
-                self.bot = Bot(token=self.bot_token)
+                self._client = self._create_client()
             except Exception as e:
-                logging.error(f"Erro ao inicializar bot do Telegram: {e}")
+                logger.error(f"Erro ao inicializar cliente do Telegram: {e}")
+    
+    def _create_client(self) -> 'httpx.Client':
+        """
+        Cria o cliente HTTP reutilizado por todos os envios (HTTP/2 se o pacote h2 estiver instalado).
+        
+        Returns:
+            httpx.Client: Cliente configurado para a API do bot
+        """
+        base_url = self.API_BASE_URL.format(token=self.bot_token)
+        try:
+            return httpx.Client(base_url=base_url, timeout=10.0, http2=True)
+        except ImportError:
+            return httpx.Client(base_url=base_url, timeout=10.0)
+    
+    def close(self) -> None:
+        """
+        Encerra o cliente HTTP, se houver um aberto.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
     
     def send_telegram_message(self, client_name: str, status: str, reason: str) -> bool:
         """
@@ -244,45 +523,138 @@ class TelegramNotifier:
             bool: True se a mensagem foi enviada com sucesso, False caso contrário
         """
         if not TELEGRAM_AVAILABLE:
-            logging.warning("Biblioteca python-telegram-bot não disponível")
+            logger.warning("Biblioteca httpx não disponível")
             return False
         
-        if not self.bot or not self.chat_id:
-            logging.warning("Bot do Telegram não configurado corretamente")
+        if not self._client or not self.chat_id:
+            logger.warning("Bot do Telegram não configurado corretamente")
             return False
         
         try:
             timestamp = datetime.now().strftime("%d/%m/%Y às %H:%M:%S")
             
-            message = f"""
-🚨 *ALERTA GUARDIÃO DIGITAL*
-
-👤 *Cliente:* {client_name}
-📊 *Status:* {status}
-❌ *Motivo:* {reason}
-🕐 *Data/Hora:* {timestamp}
-
-⚠️ Verifique o backup do cliente imediatamente!
-            """.strip()
-            
-            self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode='Markdown'
+            message = _TELEGRAM_TEMPLATE.format(
+                client_name=_escape_markdown(client_name),
+                status=_escape_markdown(status),
+                reason=_escape_markdown(reason),
+                timestamp=timestamp
             )
             
-            logging.info(f"Mensagem Telegram enviada com sucesso para chat {self.chat_id}")
+            _, attempts = _retry(lambda: self._post_message(message))
+            
+            logger.info(f"Mensagem Telegram enviada com sucesso para chat {self.chat_id} (tentativa {attempts})")
             return True
             
         except TelegramError as e:
-            logging.error(f"Erro do Telegram: {e}")
+            logger.error(f"Erro do Telegram: {e}")
             return False
         except Exception as e:
-            logging.error(f"Erro ao enviar mensagem Telegram: {e}")
+            logger.error(f"Erro ao enviar mensagem Telegram: {e}")
             return False
+    
+    def _post_message(self, message: str) -> None:
+        """
+        Envia o texto para o chat configurado.
+        
+        Args:
+            message (str): Texto da mensagem em Markdown
+        """
+        response = self._client.post(
+            "/sendMessage",
+            content=_json_dumps({'chat_id': self.chat_id, 'text': message, 'parse_mode': 'Markdown'}),
+            headers={'Content-Type': 'application/json'}
+        )
+        self._check_response(response)
+    
+    @staticmethod
+    def _check_response(response: 'httpx.Response') -> None:
+        """
+        Valida a resposta da API do Telegram.
+        
+        Args:
+            response (httpx.Response): Resposta da chamada à API
+            
+        Raises:
+            TelegramError: Se a API não confirmar o envio
+        """
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        
+        if response.status_code != 200 or not data.get('ok'):
+            description = data.get('description') or f"HTTP {response.status_code}"
+            retry_after = (data.get('parameters') or {}).get('retry_after')
+            if retry_after is None:
+                retry_after = response.headers.get('Retry-After')
+            try:
+                retry_after = float(retry_after) if retry_after is not None else None
+            except ValueError:
+                retry_after = None
+            raise TelegramError(description, response.status_code, retry_after)
+
+
+def create_notifiers(config_file: str = 'config.ini') -> dict:
+    """
+    Cria os notificadores habilitados para serem reutilizados em um lote de alertas.
+    
+    Args:
+        config_file (str): Caminho para o arquivo de configuração
+        
+    Returns:
+        dict: Dicionário com as chaves 'email' e 'telegram' (None se desabilitado)
+    """
+    config_manager = AlerterConfig.get(config_file)
+    general_config = config_manager.get_general_config()
+    notifiers = {'email': None, 'telegram': None}
+    
+    if general_config['enable_email']:
+        try:
+            notifiers['email'] = EmailNotifier(config_manager.get_email_config())
+        except Exception as e:
+            logger.error(f"Erro ao processar notificação por email: {e}")
+    
+    if general_config['enable_telegram']:
+        try:
+            notifiers['telegram'] = TelegramNotifier(config_manager.get_telegram_config())
+        except Exception as e:
+            logger.error(f"Erro ao processar notificação Telegram: {e}")
+    
+    return notifiers
+
+
+def close_notifiers(notifiers: dict) -> None:
+    """
+    Libera as conexões mantidas pelos notificadores criados por create_notifiers().
+    
+    Args:
+        notifiers (dict): Notificadores retornados por create_notifiers()
+    """
+    for notifier in (notifiers.get('email'), notifiers.get('telegram')):
+        if notifier is not None:
+            notifier.close()
 
 
-def send_alert(client_name: str, status: str, reason: str, config_file: str = 'config.ini') -> dict:
+def _notify(send: Callable[[], bool], error_message: str) -> bool:
+    """
+    Executa o envio por um canal, registrando qualquer exceção.
+    
+    Args:
+        send (Callable[[], bool]): Função que realiza o envio
+        error_message (str): Mensagem registrada em caso de exceção
+        
+    Returns:
+        bool: Resultado do envio (False em caso de exceção)
+    """
+    try:
+        return send()
+    except Exception as e:
+        logger.error(f"{error_message}: {e}")
+        return False
+
+
+def send_alert(client_name: str, status: str, reason: str, config_file: str = 'config.ini',
+               notifiers: Optional[dict] = None) -> dict:
     """
     Função principal para envio de alertas via email e/ou Telegram.
     
@@ -294,54 +666,66 @@ def send_alert(client_name: str, status: str, reason: str, config_file: str = 'c
         status (str): Status do backup (ex: "FALHA", "ERRO")
         reason (str): Motivo da falha ou detalhes adicionais
         config_file (str): Caminho para o arquivo de configuração
+        notifiers (Optional[dict]): Notificadores já criados por create_notifiers(),
+            permitindo reutilizar as conexões entre vários alertas
         
     Returns:
         dict: Dicionário com resultados do envio (email_sent, telegram_sent)
     """
     results = {'email_sent': False, 'telegram_sent': False}
+    owns_notifiers = notifiers is None
     
     try:
-        # Carregar configurações
-        config_manager = AlerterConfig(config_file)
-        general_config = config_manager.get_general_config()
-        
-        # Configurar logging
-        log_level = getattr(logging, general_config['log_level'].upper(), logging.INFO)
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        logging.info(f"Enviando alerta para cliente: {client_name}")
+        logger.info(f"Enviando alerta para cliente: {client_name}")
         
-        # Enviar email se habilitado
-        if general_config['enable_email']:
-            try:
-                email_config = config_manager.get_email_config()
-                email_notifier = EmailNotifier(email_config)
-                results['email_sent'] = email_notifier.send_email(client_name, status, reason)
-            except Exception as e:
-                logging.error(f"Erro ao processar notificação por email: {e}")
+        if owns_notifiers:
+            notifiers = create_notifiers(config_file)
         
-        # Enviar Telegram se habilitado
-        if general_config['enable_telegram']:
-            try:
-                telegram_config = config_manager.get_telegram_config()
-                telegram_notifier = TelegramNotifier(telegram_config)
-                results['telegram_sent'] = telegram_notifier.send_telegram_message(client_name, status, reason)
-            except Exception as e:
-                logging.error(f"Erro ao processar notificação Telegram: {e}")
+        try:
+            channels = {}
+            
+            # Enviar email se habilitado
+            if notifiers.get('email') is not None:
+                channels['email_sent'] = (
+                    lambda: notifiers['email'].send_email(client_name, status, reason),
+                    "Erro ao processar notificação por email"
+                )
+            
+            # Enviar Telegram se habilitado
+            if notifiers.get('telegram') is not None:
+                channels['telegram_sent'] = (
+                    lambda: notifiers['telegram'].send_telegram_message(client_name, status, reason),
+                    "Erro ao processar notificação Telegram"
+                )
+            
+            if owns_notifiers and len(channels) > 1:
+                # Chamada avulsa: enviar email e Telegram em paralelo. Com notificadores
+                # compartilhados o paralelismo já vem do pool de alertas do chamador.
+                with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                    futures = {key: executor.submit(_notify, *channel) for key, channel in channels.items()}
+                for key, future in futures.items():
+                    results[key] = future.result()
+            else:
+                for key, channel in channels.items():
+                    results[key] = _notify(*channel)
+        finally:
+            if owns_notifiers:
+                close_notifiers(notifiers)
         
         return results
         
     except Exception as e:
-        logging.error(f"Erro geral no sistema de alertas: {e}")
+        logger.error(f"Erro geral no sistema de alertas: {e}")
         return results
 
 
 if __name__ == "__main__":
     # Teste do módulo
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
     print("Testando módulo de alertas...")
     result = send_alert("Cliente Teste", "FALHA", "Arquivo de log não encontrado")
     print(f"Resultados do teste: {result}")
\ No newline at end of file
@@ -10,17 +10,28 @@ Data: 2024
 
 import os
 import re
+import mmap
 import logging
+import functools
 import configparser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import FrozenSet, List, Dict, Tuple, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Importar o módulo de alertas
 try:
-    from alerter import send_alert
+    from alerter import AlerterConfig, cached_config, send_alert, create_notifiers, close_notifiers
 except ImportError:
-    logging.error("Módulo alerter.py não encontrado. Certifique-se de que está no mesmo diretório.")
+    logger.error("Módulo alerter.py não encontrado. Certifique-se de que está no mesmo diretório.")
     raise
 
 
@@ -43,6 +54,20 @@ class LogCheckerConfig:
         self.config_file = config_file
         self.load_config()
     
+    @classmethod
+    def get(cls, config_file: str = 'config.ini') -> 'LogCheckerConfig':
+        """
+        Retorna a configuração do arquivo, reutilizando a instância em cache
+        enquanto o mtime e o tamanho do arquivo não mudarem.
+        
+        Args:
+            config_file (str): Caminho para o arquivo de configuração
+            
+        Returns:
+            LogCheckerConfig: Configuração carregada
+        """
+        return cached_config(cls, config_file)
+    
     def load_config(self) -> None:
         """
         Carrega as configurações do arquivo config.ini.
@@ -53,7 +78,7 @@ class LogCheckerConfig:
         try:
             self.config.read(self.config_file, encoding='utf-8')
         except Exception as e:
-            logging.error(f"Erro ao carregar arquivo de configuração: {e}")
+            logger.error(f"Erro ao carregar arquivo de configuração: {e}")
             raise
     
     def get_log_checker_config(self) -> dict:
@@ -81,6 +106,15 @@ class BackupLogAnalyzer:
     foram executados com sucesso ou falharam.
     """
     
+    # Tamanho do final do conteúdo onde o resumo "Erros: N" é procurado primeiro
+    ERROR_TAIL_BYTES = 4096
+    
+    # Arquivos maiores que isto são analisados primeiro apenas pelo final
+    TAIL_READ_BYTES = 16384
+    
+    # Tamanho dos blocos decodificados ao procurar o contador de erros em arquivos mapeados
+    SCAN_CHUNK_BYTES = 1024 * 1024
+    
     def __init__(self, success_string: str, error_pattern: str):
         """
         Inicializa o analisador com os padrões de sucesso e erro.
@@ -91,6 +125,152 @@ class BackupLogAnalyzer:
         """
         self.success_string = success_string
         self.error_pattern = re.compile(error_pattern)
+        
+        # String de sucesso em bytes, procurada diretamente no arquivo mapeado
+        self._success_bytes = success_string.encode('utf-8')
+        
+        # Autômato Aho-Corasick que localiza sucesso e marcador de erro em uma única passada
+        # sobre conteúdo já carregado (analyze_log_content); arquivos usam a leitura via mmap
+        self._error_marker = self._literal_prefix(error_pattern)
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and success_string and self._error_marker:
+            self._automaton = ahocorasick.Automaton()
+            self._automaton.add_word(success_string, ('success', len(success_string)))
+            self._automaton.add_word(self._error_marker, ('errmark', len(self._error_marker)))
+            self._automaton.make_automaton()
+    
+    @staticmethod
+    def _literal_prefix(pattern: str) -> str:
+        """
+        Extrai o prefixo literal obrigatório de um padrão regex (ex: "Erros:" em "Erros:\\s*(\\d+)").
+        
+        Args:
+            pattern (str): Padrão regex
+            
+        Returns:
+            str: Prefixo literal, ou string vazia se não for possível determiná-lo
+        """
+        if '|' in pattern:
+            return ''
+        
+        match = re.match(r'[^\\.^$*+?{}\[\]|()]*', pattern)
+        prefix = match.group(0)
+        
+        # Um quantificador logo após o prefixo torna seu último caractere opcional
+        if prefix and pattern[len(prefix):len(prefix) + 1] in ('*', '?', '{'):
+            prefix = prefix[:-1]
+        
+        return prefix
+    
+    def _scan_with_automaton(self, log_content: str) -> Tuple[bool, Optional[int]]:
+        """
+        Percorre o conteúdo uma única vez com o autômato Aho-Corasick.
+        
+        Args:
+            log_content (str): Conteúdo completo do arquivo de log
+            
+        Returns:
+            Tuple[bool, Optional[int]]: (has_success, error_count); error_count é None
+            se o último marcador de erro não corresponder ao padrão completo
+        """
+        has_success = False
+        last_marker = -1
+        
+        for end, (kind, length) in self._automaton.iter(log_content):
+            if kind == 'success':
+                has_success = True
+            else:
+                last_marker = end - length + 1
+        
+        if last_marker == -1:
+            return has_success, 0
+        
+        match = self.error_pattern.match(log_content, last_marker)
+        if not match:
+            return has_success, None
+        return has_success, int(match.group(1))
+    
+    def _classify(self, has_success: bool, error_count: int) -> Tuple[bool, str]:
+        """
+        Determina o status final a partir da presença da string de sucesso
+        e do último contador de erros encontrado.
+        
+        Args:
+            has_success (bool): Se a string de sucesso foi encontrada
+            error_count (int): Último número de erros reportado (0 se ausente)
+            
+        Returns:
+            Tuple[bool, str]: (is_success, reason) - True se sucesso, False se falha
+        """
+        has_errors = error_count > 0
+        
+        if has_success and not has_errors:
+            return True, "Backup concluído com sucesso"
+        elif has_success and has_errors:
+            return False, f"Backup concluído mas com {error_count} erro(s) reportado(s)"
+        elif not has_success and has_errors:
+            return False, f"Backup falhou com {error_count} erro(s) reportado(s)"
+        else:
+            return False, "String de sucesso não encontrada no log"
+    
+    def _find_last_error(self, content: str) -> Optional[re.Match]:
+        """
+        Localiza a última ocorrência do padrão de erros sem montar lista de matches.
+        
+        Procura primeiro no final do conteúdo (onde fica o resumo) e só percorre
+        o conteúdo inteiro se não houver ocorrência ali.
+        
+        Args:
+            content (str): Conteúdo do log
+            
+        Returns:
+            Optional[re.Match]: Última ocorrência, ou None se não houver
+        """
+        # Iniciar a janela no começo de uma linha para não cortar uma ocorrência ao meio
+        tail_start = max(0, content.rfind('\n', 0, max(0, len(content) - self.ERROR_TAIL_BYTES)))
+        
+        last_match = None
+        for last_match in self.error_pattern.finditer(content, tail_start):
+            pass
+        if last_match is None:
+            for last_match in self.error_pattern.finditer(content):
+                pass
+        return last_match
+    
+    def _find_last_error_mapped(self, mm: mmap.mmap) -> Optional[re.Match]:
+        """
+        Localiza a última ocorrência do padrão de erros em um arquivo mapeado.
+        
+        O arquivo é percorrido do final para o início em blocos alinhados a
+        linhas; cada bloco é decodificado e analisado com o mesmo padrão (str)
+        de analyze_log_content, parando no primeiro bloco com ocorrência.
+        
+        Args:
+            mm (mmap.mmap): Conteúdo do arquivo mapeado (somente leitura)
+            
+        Returns:
+            Optional[re.Match]: Última ocorrência, ou None se não houver
+        """
+        end = len(mm)
+        chunk_size = self.ERROR_TAIL_BYTES
+        
+        while end > 0:
+            start = max(0, end - chunk_size)
+            if start > 0:
+                # Iniciar o bloco no começo de uma linha para não cortar uma ocorrência ao meio
+                start = mm.rfind(b'\n', 0, start) + 1
+            
+            chunk = str(mm[start:end], 'utf-8', 'ignore')
+            last_match = None
+            for last_match in self.error_pattern.finditer(chunk):
+                pass
+            if last_match is not None:
+                return last_match
+            
+            end = start
+            chunk_size = self.SCAN_CHUNK_BYTES
+        
+        return None
     
     def analyze_log_content(self, log_content: str) -> Tuple[bool, str]:
         """
@@ -103,37 +283,68 @@ class BackupLogAnalyzer:
             Tuple[bool, str]: (is_success, reason) - True se sucesso, False se falha
         """
         try:
-            # Verificar se contém a string de sucesso
-            has_success = self.success_string in log_content
-            
-            # Verificar se há erros reportados
-            error_matches = self.error_pattern.findall(log_content)
-            has_errors = False
-            error_count = 0
-            
-            if error_matches:
-                # Pegar o último match (mais recente)
-                error_count = int(error_matches[-1])
-                has_errors = error_count > 0
-            
-            # Determinar status final
-            if has_success and not has_errors:
-                return True, "Backup concluído com sucesso"
-            elif has_success and has_errors:
-                return False, f"Backup concluído mas com {error_count} erro(s) reportado(s)"
-            elif not has_success and has_errors:
-                return False, f"Backup falhou com {error_count} erro(s) reportado(s)"
-            else:
-                return False, "String de sucesso não encontrada no log"
+            error_count = None
+            if self._automaton is not None:
+                has_success, error_count = self._scan_with_automaton(log_content)
+            
+            if error_count is None:
+                # Verificar se contém a string de sucesso
+                has_success = self.success_string in log_content
+                
+                # Verificar se há erros reportados (último match, o mais recente)
+                last_match = self._find_last_error(log_content)
+                error_count = int(last_match.group(1)) if last_match is not None else 0
+            
+            return self._classify(has_success, error_count)
                 
         except Exception as e:
-            logging.error(f"Erro ao analisar conteúdo do log: {e}")
+            logger.error(f"Erro ao analisar conteúdo do log: {e}")
             return False, f"Erro na análise do log: {str(e)}"
     
+    def _analyze_mapped(self, mm: mmap.mmap) -> Tuple[bool, str]:
+        """
+        Analisa um arquivo de log mapeado em memória, sem copiá-lo para uma string.
+        
+        Args:
+            mm (mmap.mmap): Conteúdo do arquivo mapeado (somente leitura)
+            
+        Returns:
+            Tuple[bool, str]: (is_success, reason) - True se sucesso, False se falha
+        """
+        has_success = mm.find(self._success_bytes) != -1
+        
+        last_match = self._find_last_error_mapped(mm)
+        error_count = int(last_match.group(1)) if last_match is not None else 0
+        return self._classify(has_success, error_count)
+    
+    def _analyze_tail(self, tail: str) -> Optional[Tuple[bool, str]]:
+        """
+        Analisa apenas o final do log, onde o Cobian grava o resumo da execução.
+        
+        Args:
+            tail (str): Trecho final do arquivo de log
+            
+        Returns:
+            Optional[Tuple[bool, str]]: Resultado da análise, ou None se o trecho não
+            contiver a string de sucesso e o contador de erros (exigindo leitura completa)
+        """
+        if self.success_string not in tail:
+            return None
+        
+        last_match = self._find_last_error(tail)
+        if last_match is None:
+            return None
+        
+        return self._classify(True, int(last_match.group(1)))
+    
     def analyze_log_file(self, log_file_path: str) -> Tuple[bool, str]:
         """
         Analisa um arquivo de log específico.
         
+        Logs grandes são resolvidos pelo final quando possível. O padrão de erros
+        é sempre aplicado sobre texto decodificado, com a mesma semântica de
+        analyze_log_content.
+        
         Args:
             log_file_path (str): Caminho para o arquivo de log
             
@@ -141,15 +352,28 @@ class BackupLogAnalyzer:
             Tuple[bool, str]: (is_success, reason) - True se sucesso, False se falha
         """
         try:
-            with open(log_file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                content = file.read()
-                return self.analyze_log_content(content)
+            with open(log_file_path, 'rb') as file:
+                size = os.fstat(file.fileno()).st_size
+                if size == 0:
+                    # mmap não aceita arquivos vazios
+                    return self.analyze_log_content('')
+                
+                # O resumo fica no final do log: tentar resolver lendo só a cauda
+                if size > self.TAIL_READ_BYTES:
+                    file.seek(-self.TAIL_READ_BYTES, os.SEEK_END)
+                    tail = file.read().decode('utf-8', errors='ignore')
+                    result = self._analyze_tail(tail)
+                    if result is not None:
+                        return result
+                
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._analyze_mapped(mm)
         except FileNotFoundError:
             return False, "Arquivo de log não encontrado"
         except PermissionError:
             return False, "Sem permissão para ler o arquivo de log"
         except Exception as e:
-            logging.error(f"Erro ao ler arquivo de log {log_file_path}: {e}")
+            logger.error(f"Erro ao ler arquivo de log {log_file_path}: {e}")
             return False, f"Erro ao ler arquivo: {str(e)}"
 
 
@@ -171,6 +395,90 @@ class ClientDirectoryScanner:
         """
         self.base_directory = Path(base_directory)
         self.log_file_pattern = log_file_pattern
+        
+        # Regex equivalente ao padrão, capturando a data do nome do arquivo. Padrão e
+        # nomes são comparados após os.path.normcase, ignorando maiúsculas/minúsculas
+        # no Windows como os.path.exists
+        self._log_file_regex = re.compile(
+            re.escape(os.path.normcase(log_file_pattern)).replace(re.escape('{date}'), r'(\d{4}-\d{2}-\d{2})')
+        )
+        
+        # Padrões com subdiretório não podem ser resolvidos pela listagem do diretório do cliente
+        self._pattern_has_dirs = any(sep and sep in log_file_pattern for sep in (os.sep, os.altsep))
+        
+        # Cache das listagens de diretório, ativo apenas durante uma verificação em lote
+        self._cache_token: Optional[int] = None
+        self._next_cache_token = 0
+        self._cached_listing = functools.lru_cache(maxsize=None)(self._list_client_files)
+    
+    def start_file_cache(self) -> None:
+        """
+        Ativa o cache de listagens: cada diretório de cliente passa a ser lido
+        uma única vez até clear_file_cache() ser chamado.
+        """
+        self._cached_listing.cache_clear()
+        self._next_cache_token += 1
+        self._cache_token = self._next_cache_token
+    
+    def clear_file_cache(self) -> None:
+        """
+        Desativa e descarta o cache de listagens de diretório.
+        """
+        self._cache_token = None
+        self._cached_listing.cache_clear()
+    
+    def _list_client_files(self, client_name: str, cache_token: Optional[int] = None) -> FrozenSet[str]:
+        """
+        Lê o diretório do cliente com uma única chamada a os.scandir.
+        
+        Args:
+            client_name (str): Nome do cliente
+            cache_token (Optional[int]): Token do lote atual (apenas compõe a chave do cache)
+            
+        Returns:
+            FrozenSet[str]: Nomes dos arquivos (normalizados com os.path.normcase)
+        """
+        try:
+            with os.scandir(self.base_directory / client_name) as entries:
+                return frozenset(os.path.normcase(entry.name) for entry in entries if entry.is_file())
+        except OSError:
+            return frozenset()
+    
+    def list_client_files(self, client_name: str) -> FrozenSet[str]:
+        """
+        Retorna os nomes dos arquivos do diretório de um cliente.
+        
+        Os nomes são normalizados com os.path.normcase (minúsculas no Windows),
+        para que as comparações sigam as regras do sistema de arquivos.
+        
+        Args:
+            client_name (str): Nome do cliente
+            
+        Returns:
+            FrozenSet[str]: Nomes dos arquivos do diretório (vazio se não existir)
+        """
+        if self._cache_token is None:
+            return self._list_client_files(client_name)
+        return self._cached_listing(client_name, self._cache_token)
+    
+    def log_file_exists(self, client_name: str, log_file_path: str) -> bool:
+        """
+        Verifica se um arquivo de log do cliente existe, consultando primeiro a
+        listagem do diretório e recorrendo a os.path.exists quando o padrão inclui
+        subdiretórios ou o nome não aparece na listagem.
+        
+        Args:
+            client_name (str): Nome do cliente
+            log_file_path (str): Caminho completo do arquivo de log
+            
+        Returns:
+            bool: True se o arquivo existir
+        """
+        if not self._pattern_has_dirs:
+            filename = os.path.normcase(os.path.basename(log_file_path))
+            if filename in self.list_client_files(client_name):
+                return True
+        return os.path.exists(log_file_path)
     
     def get_client_directories(self) -> List[str]:
         """
@@ -181,7 +489,7 @@ class ClientDirectoryScanner:
         """
         try:
             if not self.base_directory.exists():
-                logging.warning(f"Diretório base não existe: {self.base_directory}")
+                logger.warning(f"Diretório base não existe: {self.base_directory}")
                 return []
             
             client_dirs = []
@@ -189,11 +497,11 @@ class ClientDirectoryScanner:
                 if item.is_dir():
                     client_dirs.append(item.name)
             
-            logging.info(f"Encontrados {len(client_dirs)} diretórios de clientes")
+            logger.info(f"Encontrados {len(client_dirs)} diretórios de clientes")
             return sorted(client_dirs)
             
         except Exception as e:
-            logging.error(f"Erro ao escanear diretórios de clientes: {e}")
+            logger.error(f"Erro ao escanear diretórios de clientes: {e}")
             return []
     
     def get_log_file_path(self, client_name: str, target_date: datetime) -> str:
@@ -222,20 +530,45 @@ class ClientDirectoryScanner:
         Returns:
             Optional[str]: Caminho do arquivo encontrado ou None
         """
-        client_dir = self.base_directory / client_name
-        if not client_dir.exists():
+        today = datetime.now().date()
+        oldest = today - timedelta(days=days_back)
+        
+        # Padrão sem {date}: o nome do arquivo é fixo, basta verificar se existe
+        if self._log_file_regex.groups == 0:
+            log_path = self.get_log_file_path(client_name, datetime.now())
+            if not self.log_file_exists(client_name, log_path):
+                return None
+            logger.info(f"Arquivo de log encontrado para {client_name}: {log_path}")
+            return log_path
+        
+        # Padrão com subdiretório: verificar cada dia candidato diretamente
+        if self._pattern_has_dirs:
+            for i in range(days_back + 1):
+                log_path = self.get_log_file_path(client_name, datetime.now() - timedelta(days=i))
+                if os.path.exists(log_path):
+                    logger.info(f"Arquivo de log encontrado para {client_name}: {log_path}")
+                    return log_path
             return None
         
-        # Procurar por arquivos de log nos últimos dias
-        for i in range(days_back + 1):
-            check_date = datetime.now() - timedelta(days=i)
-            log_path = self.get_log_file_path(client_name, check_date)
-            
-            if os.path.exists(log_path):
-                logging.info(f"Arquivo de log encontrado para {client_name}: {log_path}")
-                return log_path
+        # Uma única leitura do diretório em vez de um stat por dia candidato
+        candidates = []
+        for filename in self.list_client_files(client_name):
+            match = self._log_file_regex.fullmatch(filename)
+            if not match:
+                continue
+            try:
+                log_date = datetime.strptime(match.group(1), "%Y-%m-%d").date()
+            except (IndexError, ValueError):
+                continue
+            if oldest <= log_date <= today:
+                candidates.append((log_date, filename))
         
-        return None
+        if not candidates:
+            return None
+        
+        log_path = str(self.base_directory / client_name / max(candidates)[1])
+        logger.info(f"Arquivo de log encontrado para {client_name}: {log_path}")
+        return log_path
 
 
 class GuardiaoDigitalLogChecker:
@@ -246,6 +579,15 @@ class GuardiaoDigitalLogChecker:
     do sistema Guardião Digital.
     """
     
+    # Número máximo de threads para verificação de clientes e envio de alertas
+    MAX_CHECK_WORKERS = 32
+    MAX_ALERT_WORKERS = 5
+    
+    # Interrupção do lote de alertas quando ao menos 1/3 dos envios falha
+    # (avaliada apenas em lotes com ABORT_MIN_BATCH falhas ou mais)
+    ABORT_MIN_BATCH = 30
+    ABORT_MIN_FAILED = 10
+    
     def __init__(self, config_file: str = 'config.ini'):
         """
         Inicializa o verificador de logs com as configurações especificadas.
@@ -254,7 +596,7 @@ class GuardiaoDigitalLogChecker:
             config_file (str): Caminho para o arquivo de configuração
         """
         self.config_file = config_file
-        self.config_manager = LogCheckerConfig(config_file)
+        self.config_manager = LogCheckerConfig.get(config_file)
         self.config = self.config_manager.get_log_checker_config()
         
         # Inicializar componentes
@@ -267,14 +609,6 @@ class GuardiaoDigitalLogChecker:
             self.config['success_string'],
             self.config['error_pattern']
         )
-        
-        # Configurar logging
-        if self.config['enable_detailed_logging']:
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
     
     def check_client_backup(self, client_name: str, target_date: datetime = None) -> Dict[str, any]:
         """
@@ -303,7 +637,9 @@ class GuardiaoDigitalLogChecker:
             # Procurar arquivo de log
             log_file_path = self.scanner.get_log_file_path(client_name, target_date)
             
-            if not os.path.exists(log_file_path):
+            if not self.scanner.log_file_exists(client_name, log_file_path):
+                log_file_path = None
+                
                 # Tentar encontrar log mais recente se configurado
                 if self.config['check_previous_days'] > 0:
                     log_file_path = self.scanner.find_latest_log_file(
@@ -311,7 +647,7 @@ class GuardiaoDigitalLogChecker:
                         self.config['check_previous_days']
                     )
                 
-                if not log_file_path or not os.path.exists(log_file_path):
+                if not log_file_path:
                     result['reason'] = f"Arquivo de log não encontrado para a data {target_date.strftime('%Y-%m-%d')}"
                     return result
             
@@ -323,11 +659,11 @@ class GuardiaoDigitalLogChecker:
             result['success'] = success
             result['reason'] = reason
             
-            logging.info(f"Cliente {client_name}: {'SUCESSO' if success else 'FALHA'} - {reason}")
+            logger.info(f"Cliente {client_name}: {'SUCESSO' if success else 'FALHA'} - {reason}")
             
         except Exception as e:
             result['reason'] = f"Erro durante verificação: {str(e)}"
-            logging.error(f"Erro ao verificar cliente {client_name}: {e}")
+            logger.error(f"Erro ao verificar cliente {client_name}: {e}")
         
         return result
     
@@ -344,14 +680,20 @@ class GuardiaoDigitalLogChecker:
         if target_date is None:
             target_date = datetime.now()
         
-        logging.info(f"Iniciando verificação de todos os clientes para {target_date.strftime('%Y-%m-%d')}")
+        logger.info(f"Iniciando verificação de todos os clientes para {target_date.strftime('%Y-%m-%d')}")
         
         clients = self.scanner.get_client_directories()
-        results = []
+        if not clients:
+            return []
         
-        for client_name in clients:
-            result = self.check_client_backup(client_name, target_date)
-            results.append(result)
+        # Verificações são limitadas por I/O: executar em paralelo,
+        # lendo cada diretório de cliente uma única vez durante o lote
+        self.scanner.start_file_cache()
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CHECK_WORKERS, len(clients))) as executor:
+                results = list(executor.map(lambda c: self.check_client_backup(c, target_date), clients))
+        finally:
+            self.scanner.clear_file_cache()
         
         return results
     
@@ -369,35 +711,89 @@ class GuardiaoDigitalLogChecker:
             'total_clients': len(results),
             'successful_backups': 0,
             'failed_backups': 0,
-            'alerts_sent': 0
+            'alerts_sent': 0,
+            'alerts_aborted': 0
         }
         
-        for result in results:
-            if result['success']:
-                stats['successful_backups'] += 1
-            else:
-                stats['failed_backups'] += 1
+        failures = [result for result in results if not result['success']]
+        stats['successful_backups'] = len(results) - len(failures)
+        stats['failed_backups'] = len(failures)
+        
+        if not failures:
+            return stats
+        
+        guard_enabled = len(failures) >= self.ABORT_MIN_BATCH
+        attempted = 0
+        failed = 0
+        abort = False
+        aborted = []
+        
+        # Notificadores compartilhados por todos os alertas do lote
+        notifiers = create_notifiers(self.config_file)
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_ALERT_WORKERS, len(failures))) as executor:
+                futures = {executor.submit(self._send_failure_alert, r, notifiers): r for r in failures}
                 
-                # Enviar alerta
-                try:
-                    alert_result = send_alert(
-                        client_name=result['client_name'],
-                        status="FALHA",
-                        reason=result['reason'],
-                        config_file=self.config_file
-                    )
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        aborted.append(futures[future])
+                        continue
                     
-                    if alert_result['email_sent'] or alert_result['telegram_sent']:
+                    attempted += 1
+                    if future.result():
                         stats['alerts_sent'] += 1
-                        logging.info(f"Alerta enviado para cliente {result['client_name']}")
                     else:
-                        logging.warning(f"Falha ao enviar alerta para cliente {result['client_name']}")
-                        
-                except Exception as e:
-                    logging.error(f"Erro ao enviar alerta para {result['client_name']}: {e}")
+                        failed += 1
+                    
+                    if (guard_enabled and not abort and failed >= self.ABORT_MIN_FAILED
+                            and failed * 3 >= attempted):
+                        logger.error(f"Abortando alertas restantes: alta taxa de falhas "
+                                     f"({failed} de {attempted} envios falharam)")
+                        # Os alertas ainda não iniciados passam a chegar como cancelados
+                        abort = True
+                        for pending in futures:
+                            pending.cancel()
+        finally:
+            close_notifiers(notifiers)
+        
+        if aborted:
+            stats['alerts_aborted'] = len(aborted)
+            logger.warning(f"Alertas não enviados (lote abortado): "
+                           f"{', '.join(result['client_name'] for result in aborted)}")
         
         return stats
     
+    def _send_failure_alert(self, result: Dict[str, any], notifiers: dict) -> bool:
+        """
+        Envia o alerta de falha de um cliente usando os notificadores compartilhados.
+        
+        Args:
+            result (Dict[str, any]): Resultado da verificação do cliente
+            notifiers (dict): Notificadores criados por create_notifiers()
+            
+        Returns:
+            bool: True se ao menos um canal confirmou o envio
+        """
+        try:
+            alert_result = send_alert(
+                client_name=result['client_name'],
+                status="FALHA",
+                reason=result['reason'],
+                config_file=self.config_file,
+                notifiers=notifiers
+            )
+            
+            if alert_result['email_sent'] or alert_result['telegram_sent']:
+                logger.info(f"Alerta enviado para cliente {result['client_name']}")
+                return True
+            
+            logger.warning(f"Falha ao enviar alerta para cliente {result['client_name']}")
+            
+        except Exception as e:
+            logger.error(f"Erro ao enviar alerta para {result['client_name']}: {e}")
+        
+        return False
+    
     def run_daily_check(self) -> None:
         """
         Executa a verificação diária completa de todos os clientes.
@@ -405,7 +801,7 @@ class GuardiaoDigitalLogChecker:
         Esta é a função principal que deve ser chamada pelo agendador de tarefas
         ou executada manualmente para verificar todos os backups do dia.
         """
-        logging.info("=== INICIANDO VERIFICAÇÃO DIÁRIA GUARDIÃO DIGITAL ===")
+        logger.info("=== INICIANDO VERIFICAÇÃO DIÁRIA GUARDIÃO DIGITAL ===")
         
         try:
             # Verificar todos os clientes
@@ -415,19 +811,24 @@ class GuardiaoDigitalLogChecker:
             stats = self.process_failures_and_alert(results)
             
             # Log de estatísticas finais
-            logging.info("=== RESUMO DA VERIFICAÇÃO ===")
-            logging.info(f"Total de clientes: {stats['total_clients']}")
-            logging.info(f"Backups bem-sucedidos: {stats['successful_backups']}")
-            logging.info(f"Backups com falha: {stats['failed_backups']}")
-            logging.info(f"Alertas enviados: {stats['alerts_sent']}")
+            logger.info("=== RESUMO DA VERIFICAÇÃO ===")
+            logger.info(f"Total de clientes: {stats['total_clients']}")
+            logger.info(f"Backups bem-sucedidos: {stats['successful_backups']}")
+            logger.info(f"Backups com falha: {stats['failed_backups']}")
+            logger.info(f"Alertas enviados: {stats['alerts_sent']}")
+            if stats['alerts_aborted']:
+                logger.warning(f"Alertas abortados: {stats['alerts_aborted']}")
             
             if stats['failed_backups'] == 0:
-                logging.info("🎉 Todos os backups foram executados com sucesso!")
+                logger.info("🎉 Todos os backups foram executados com sucesso!")
+            elif stats['alerts_aborted']:
+                logger.warning(f"⚠️ {stats['failed_backups']} backup(s) falharam; envio de alertas interrompido "
+                               f"com {stats['alerts_aborted']} alerta(s) pendente(s)")
             else:
-                logging.warning(f"⚠️ {stats['failed_backups']} backup(s) falharam e alertas foram enviados")
+                logger.warning(f"⚠️ {stats['failed_backups']} backup(s) falharam e alertas foram enviados")
             
         except Exception as e:
-            logging.error(f"Erro durante verificação diária: {e}")
+            logger.error(f"Erro durante verificação diária: {e}")
             # Tentar enviar alerta sobre erro do sistema
             try:
                 send_alert(
@@ -440,6 +841,30 @@ class GuardiaoDigitalLogChecker:
                 pass  # Se não conseguir enviar alerta, pelo menos loggar o erro
 
 
+def configure_logging(config_file: str = 'config.ini') -> None:
+    """
+    Configura o logging da aplicação a partir do config.ini.
+    
+    Os módulos apenas emitem mensagens pelos seus loggers; a configuração
+    global é feita uma única vez pelo ponto de entrada da aplicação.
+    
+    Args:
+        config_file (str): Caminho para o arquivo de configuração
+    """
+    general_config = AlerterConfig.get(config_file).get_general_config()
+    log_level = getattr(logging, general_config['log_level'].upper(), logging.INFO)
+    
+    # Logging detalhado garante ao menos o nível INFO
+    if LogCheckerConfig.get(config_file).get_log_checker_config()['enable_detailed_logging']:
+        log_level = min(log_level, logging.INFO)
+    
+    logging.basicConfig(
+        level=log_level,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+
 def main():
     """
     Função principal para execução do script.
@@ -447,10 +872,11 @@ def main():
     Pode ser executada diretamente ou importada por outros módulos.
     """
     try:
+        configure_logging()
         checker = GuardiaoDigitalLogChecker()
         checker.run_daily_check()
     except Exception as e:
-        logging.error(f"Erro crítico na execução: {e}")
+        logger.error(f"Erro crítico na execução: {e}")
         return 1
     
     return 0